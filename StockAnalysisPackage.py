@@ -1,11 +1,474 @@
 # import neccessary packages
+import numpy as np
 import pandas as pd
-import yfinance as yf
-from datetime import datetime, date
-import plotly.graph_objects as go
+from datetime import date
+# plotly and yfinance are heavy to import, so they are imported inside the functions that use them.
+
+import functools
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import warnings
-warnings.filterwarnings('ignore')
+
+try:
+    import bottleneck as bn
+except ImportError:   # bottleneck is optional, moving averages then use the numba kernel below.
+    bn = None
+
+try:
+    from numba import njit, prange, types
+
+    NUMBA_AVAILABLE = True
+
+    # Close reaches the kernels as float32 or float64, either as a fresh contiguous array or as a read-only view handed out by pandas.
+    # Writable arrays match the 'C' signature exactly, anything else converts to the read-only 'A' one. Two 'A' signatures differing only in
+    # writability would make every writable contiguous array an equally good match for both and numba would refuse the call as ambiguous.
+    _CLOSE_TYPES = [types.Array(dtype, 1, layout, readonly=readonly)
+                    for dtype in (types.float32, types.float64) for layout, readonly in (('C', False), ('A', True))]
+except ImportError:   # numba is optional, the indicator kernels below then run as plain python functions.
+    NUMBA_AVAILABLE = False
+    _CLOSE_TYPES = []
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def _signatures(make):
+    # One explicit signature per supported Close array type, so the kernels are compiled (or loaded from the numba cache) at import instead of on first call.
+    return [make(close) for close in _CLOSE_TYPES]
+
+
+# fastmath without its 'nnan' and 'ninf' flags: the kernels have to see the NaN of a missing price to skip it.
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn'}
+
+
+@njit(_signatures(lambda close: types.float64[:](close, types.int64)),
+      cache=True, fastmath=_FASTMATH, nogil=True)
+def _rolling_mean(close, window):
+
+    """
+    Single pass rolling mean over 'close', keeping a running sum with one add and one subtract per step instead of reducing every window again. The sum is accumulated in float64 so float32 prices keep their accuracy. Positions before the first full window, and windows containing a missing (NaN) price, are NaN, same as pandas rolling.
+    """
+
+    n = close.shape[0]
+    ma = np.full(n, np.nan)
+    s = 0.0
+    missing = 0   # NaN prices in the current window, kept out of the sum so it recovers once they leave the window
+    for i in range(n):
+        x = np.float64(close[i])
+        if np.isnan(x):
+            missing += 1
+        else:
+            s += x
+        if i >= window:
+            old = np.float64(close[i - window])
+            if np.isnan(old):
+                missing -= 1
+            else:
+                s -= old
+        if i >= window - 1 and missing == 0:
+            ma[i] = s / window
+    return ma
+
+
+@njit(_signatures(lambda close: types.UniTuple(types.float64[:], 3)(close, types.int64, types.float64)),
+      cache=True, fastmath=_FASTMATH, nogil=True)
+def _bollinger_kernel(close, window, num_std):
+
+    """
+    Single pass Bollinger Bands: a running sum and sum of squares like '_rolling_mean', writing the moving average and the upper and lower bands directly without materializing the standard deviation. Windows containing a missing price are NaN.
+    """
+
+    n = close.shape[0]
+    ma = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    s = 0.0
+    s2 = 0.0
+    missing = 0
+    for i in range(n):
+        # np.float64 rather than float(): numba types float() of a float32 element as float32, squaring it in single precision
+        x = np.float64(close[i])
+        if np.isnan(x):
+            missing += 1
+        else:
+            s += x
+            s2 += x * x
+        if i >= window:
+            old = np.float64(close[i - window])
+            if np.isnan(old):
+                missing -= 1
+            else:
+                s -= old
+                s2 -= old * old
+        if i >= window - 1 and missing == 0:
+            mean = s / window
+            ma[i] = mean
+            if window > 1:
+                band_width = num_std * np.sqrt(max(0.0, (s2 - s * mean) / (window - 1)))
+                upper[i] = mean + band_width
+                lower[i] = mean - band_width
+    return ma, upper, lower
+
+
+@njit(_signatures(lambda close: types.UniTuple(types.float64[:], 2)(close, types.float64, types.float64, types.float64)),
+      cache=True, fastmath=_FASTMATH, nogil=True)
+def _macd_kernel(close, a_short, a_long, a_signal):
+
+    """
+    Fused MACD recurrence: the short, long and signal exponential moving averages are advanced together in one loop over 'close', matching pandas ewm(adjust=False).
+    """
+
+    n = close.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    if n == 0:
+        return macd, signal
+    short_ema = np.float64(close[0])
+    long_ema = np.float64(close[0])
+    signal_ema = 0.0
+    for i in range(n):
+        x = np.float64(close[i])
+        short_ema = a_short * x + (1.0 - a_short) * short_ema
+        long_ema = a_long * x + (1.0 - a_long) * long_ema
+        m = short_ema - long_ema
+        signal_ema = a_signal * m + (1.0 - a_signal) * signal_ema
+        macd[i] = m
+        signal[i] = signal_ema
+    return macd, signal
+
+
+def _ema_convolve(values, alpha, tol=1e-10):
+
+    """
+    Exponential moving average matching pandas ewm(adjust=False), written as a convolution with the geometric weights alpha*(1-alpha)**k. Weights below 'tol' are truncated, and the first samples are corrected for the weight the recurrence puts on values[0].
+    """
+
+    n = values.shape[0]
+    if n == 0:
+        return np.empty(0)
+    length = min(n, max(1, int(np.ceil(np.log(tol) / np.log1p(-alpha)))))
+    decay = (1.0 - alpha) ** np.arange(length)
+    ema = np.convolve(values, alpha * decay)[:n]
+    ema[:length] += (1.0 - alpha) * decay * values[0]
+    return ema
+
+
+def _macd_convolve(close, a_short, a_long, a_signal):
+    close = close.astype(np.float64)
+    macd = _ema_convolve(close, a_short) - _ema_convolve(close, a_long)
+    return macd, _ema_convolve(macd, a_signal)
+
+
+if not NUMBA_AVAILABLE:
+    # Without numba the fused MACD loop above runs as plain python, the convolution form keeps it vectorized
+    _macd_kernel = _macd_convolve
+
+
+@njit(_signatures(lambda values: types.float64[:](values, values, types.int64)),
+      cache=True, fastmath=_FASTMATH, nogil=True)
+def _rsi_kernel(gains, losses, window):
+
+    """
+    Wilder's RSI from the daily 'gains' and 'losses' magnitudes (first element is a placeholder). Average gain and loss are seeded with the simple mean of the first 'window' changes and then smoothed recursively; positions before that are NaN.
+    """
+
+    n = gains.shape[0]
+    rsi = np.full(n, np.nan)
+    if n <= window:
+        return rsi
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, window + 1):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= window
+    avg_loss /= window
+    for i in range(window, n):
+        if i > window:
+            avg_gain = (avg_gain * (window - 1) + gains[i]) / window
+            avg_loss = (avg_loss * (window - 1) + losses[i]) / window
+        if avg_loss > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi[i] = 100.0
+    return rsi
+
+
+def _rsi_lfilter(gains, losses, window):
+
+    """
+    Same result as '_rsi_kernel', with Wilder's recursion run by scipy's 'lfilter' (seeded through its initial state) instead of a python loop.
+    """
+
+    from scipy.signal import lfilter
+
+    n = gains.shape[0]
+    rsi = np.full(n, np.nan)
+    if n <= window:
+        return rsi
+    alpha = 1.0 / window
+    averages = []
+    for values in (gains, losses):
+        seed = values[1:window + 1].mean(dtype=np.float64)
+        smoothed, _ = lfilter([alpha], [1.0, alpha - 1.0], values[window + 1:].astype(np.float64), zi=[(1.0 - alpha) * seed])
+        averages.append(np.concatenate(([seed], smoothed)))
+    avg_gain, avg_loss = averages
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi[window:] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return rsi
+
+
+if not NUMBA_AVAILABLE and importlib.util.find_spec("scipy") is not None:
+    # Without numba the Wilder loop above runs as plain python, lfilter keeps it vectorized
+    _rsi_kernel = _rsi_lfilter
+
+
+def _split_changes(close):
+
+    """
+    Splits the day over day changes of 'close' (along its last axis) into gain and loss magnitudes. The changes are written into one preallocated buffer, the first one being 0, and the split clips them with np.maximum / np.minimum, so only three arrays are allocated in total. Changes to or from a missing (NaN) price count as 0, so they do not propagate through the RSI smoothing.
+    """
+
+    changes = np.empty_like(close)
+    changes[..., :1] = 0.0
+    np.subtract(close[..., 1:], close[..., :-1], out=changes[..., 1:])
+    np.nan_to_num(changes, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    gains = np.maximum(changes, 0.0)
+    losses = np.minimum(changes, 0.0, out=changes)
+    np.negative(losses, out=losses)
+    return gains, losses
+
+
+# Batch kernels: 'closes' is a (n_symbols, n_dates) float32 array and every symbol row is processed in parallel.
+# Unlike the kernels above they are compiled lazily, on the first 'batch' call (or loaded from the numba cache then): compiling a parallel
+# kernel at import starts numba's threading layer, which slows down every import and hangs forked worker processes at exit.
+@njit(parallel=True, cache=True, nogil=True)
+def _batch_ma(closes, window):
+    out = np.empty(closes.shape)
+    for i in prange(closes.shape[0]):
+        out[i] = _rolling_mean(closes[i], window)
+    return out
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _batch_macd(closes, a_short, a_long, a_signal):
+    macd_out = np.empty(closes.shape)
+    signal_out = np.empty(closes.shape)
+    for i in prange(closes.shape[0]):
+        macd, signal = _macd_kernel(closes[i], a_short, a_long, a_signal)
+        macd_out[i] = macd
+        signal_out[i] = signal
+    return macd_out, signal_out
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _batch_rsi(gains, losses, window):
+    out = np.empty(gains.shape)
+    for i in prange(gains.shape[0]):
+        out[i] = _rsi_kernel(gains[i], losses[i], window)
+    return out
+
+
+# On-disk cache for yahoo finance responses, so re-creating an object for the same symbol and dates skips the network.
+_cache_dir = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "stockanalysis"
+PRICE_CACHE_TTL = 24 * 60 * 60   # seconds
+INFO_CACHE_TTL = 24 * 60 * 60
+NEWS_CACHE_TTL = 60 * 60
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+
+def _cache_path(suffix, *parts):
+    key = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return _cache_dir / f"{key}.{suffix}"
+
+
+def _parquet_path(symbol, start_date, end_date):
+    return _cache_dir / f"{symbol}_{start_date}_{end_date}.parquet"
+
+
+def _load(path, ttl):
+
+    """
+    Returns the cached value stored at 'path' (a dataframe for '.parquet', decoded JSON otherwise), or None when it is missing, older than 'ttl' seconds or unreadable.
+    """
+
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path, engine="pyarrow", columns=OHLCV_COLUMNS)
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError, ImportError):
+        return None
+
+
+def _store(path, value):
+
+    """
+    Writes 'value' to the cache at 'path'. Caching is best effort: failures (no pyarrow, read-only home, unserializable data) are ignored.
+    """
+
+    try:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".parquet":
+            value.to_parquet(path, engine="pyarrow", compression="zstd")
+        else:
+            with open(path, "w") as f:
+                json.dump(value, f, default=str)
+    except (OSError, ValueError, TypeError, ImportError):
+        pass
+
+
+def _prepare_ohlcv(data):
+
+    """
+    Selects the OHLCV columns of a downloaded frame in a fixed order, names its DatetimeIndex 'Date' and downcasts prices to float32 and volume to the smallest unsigned integer type, halving the memory walked by the indicators. The index is kept as is rather than copied into a column.
+    """
+
+    price_columns = OHLCV_COLUMNS[:-1]
+    # The selection and the float32 cast each produce the frame once, no reset_index or re-ordering copy follows
+    ohlcv = data[OHLCV_COLUMNS].astype({column: np.float32 for column in price_columns}).rename_axis('Date')
+    ohlcv["Volume"] = pd.to_numeric(ohlcv["Volume"], downcast='unsigned')
+    return ohlcv
+
+
+def _lttb(x, y, n_out):
+
+    """
+    Largest-Triangle-Three-Buckets downsampling: returns the indices of 'n_out' points of (x, y) that preserve the visual shape of the series. The first and last points are always kept and every bucket in between contributes the point forming the largest triangle with its neighbours. Missing values, such as an indicator's warm-up, count as 0 for the selection.
+    """
+
+    n = y.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = x.astype(np.float64)
+    y = np.nan_to_num(y.astype(np.float64))
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)   # n_out - 2 buckets between the two end points
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # The third vertex is the average of the next bucket, or the last point for the final bucket
+        if i + 2 < len(edges):
+            next_x = x[hi:edges[i + 2]].mean()
+            next_y = y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+# Column each 'visualize_data' option needs, with the message printed when it has not been calculated yet.
+PLOT_REQUIREMENTS = {
+    "ma": ("MA", "Moving average not calculated"),
+    "macd": ("MACD", "MACD not calculated"),
+    "macd_hist": ("MACD", "MACD not calculated"),
+    "bollinger_bands": ("Upper_Band", "Bollinger bands are not calculated"),
+    "rsi": ("RSI", "RSI not calculated"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _layouts():
+
+    """
+    Plotly layouts for every 'visualize_data' option, built and validated once and reused by every plot (plotly copies the layout into each figure).
+    """
+
+    import plotly.graph_objects as go
+
+    no_rangeslider = dict(visible=False)
+    return {
+        "candlestick": go.Layout(xaxis=dict(rangeslider=no_rangeslider)),
+        "ma": go.Layout(title='Candlestick Chart with Moving Average',
+                        xaxis=dict(title='Date', rangeslider=no_rangeslider),
+                        yaxis=dict(title='Price')),
+        "macd": go.Layout(title='MACD Indicator',
+                          xaxis=dict(title='Date'),
+                          yaxis=dict(title='MACD Value')),
+        "macd_hist": go.Layout(title='MACD Histogram',
+                               xaxis=dict(title='Date'),
+                               yaxis=dict(title='MACD Histogram')),
+        "bollinger_bands": go.Layout(title='Bollinger Bands',
+                                     xaxis=dict(title='Date', rangeslider=no_rangeslider),
+                                     yaxis=dict(title='Price')),
+        "rsi": go.Layout(title='Relative Strength Index (RSI)',
+                         xaxis=dict(title='Date', rangeslider=no_rangeslider),
+                         yaxis=dict(title='RSI')),
+    }
+
+
+def _no_data_error(symbol, start_date, end_date):
+    return f"Symbol Error: No price data for {symbol} between {start_date} and {end_date}"
+
+
+# In process memo of '_fetch_ohlcv', (symbol, start_date, end_date) -> (download time, frame), least recently used first.
+_ohlcv_memo = {}
+OHLCV_MEMO_SIZE = 32
+
+
+def _fetch_ohlcv(symbol, start_date, end_date):
+
+    """
+    Returns the prepared OHLCV frame of 'symbol', memoized in process on top of the parquet cache, which is in turn only refreshed from yahoo finance once expired. Both layers expire 'PRICE_CACHE_TTL' seconds after the download, so a long running process picks up new prices too. Callers must copy the frame before adding columns to it. Raises when yahoo finance returns no prices, so that a failed download is neither cached on disk nor memoized.
+    """
+
+    key = (symbol, start_date, end_date)
+    entry = _ohlcv_memo.pop(key, None)
+    if entry is not None and time.time() - entry[0] <= PRICE_CACHE_TTL:
+        _ohlcv_memo[key] = entry   # re-inserted as the most recently used
+        return entry[1]
+
+    path = _parquet_path(symbol, start_date, end_date)
+    ohlcv = _load(path, PRICE_CACHE_TTL)
+    fetched_at = time.time()
+    if ohlcv is not None:
+        try:
+            # Prices from the parquet cache were downloaded when the file was written
+            fetched_at = path.stat().st_mtime
+        except OSError:
+            pass
+    else:
+        import yfinance as yf
+        with warnings.catch_warnings():
+            # yfinance raises FutureWarnings from its own pandas usage on every download
+            warnings.simplefilter('ignore', FutureWarning)
+            data = yf.download(symbol, start=start_date, end=end_date, auto_adjust=False, progress=False)
+        # yfinance reports a failed download with an empty frame rather than an error
+        if data.empty:
+            raise Exception(_no_data_error(symbol, start_date, end_date))
+        if isinstance(data.columns, pd.MultiIndex):
+            # Recent yfinance labels even a single symbol's columns (Price, Ticker), keep the price level only
+            data = data.droplevel(1, axis=1)
+        ohlcv = _prepare_ohlcv(data)
+        _store(path, ohlcv)
+    _ohlcv_memo[key] = (fetched_at, ohlcv)
+    while len(_ohlcv_memo) > OHLCV_MEMO_SIZE:
+        del _ohlcv_memo[next(iter(_ohlcv_memo))]
+    return ohlcv
+
+
+@functools.lru_cache(maxsize=128)
+def _ticker(symbol):
+    import yfinance as yf
+    return yf.Ticker(symbol)
+
 
 class StockAnalysis:
     
@@ -32,42 +495,83 @@ class StockAnalysis:
       self.symbol = symbol
       self.start_date = start_date
       self.end_date = end_date
+      # Parsed once so the fetch validation compares dates rather than strings, whatever format pandas can read was given
+      self._start_d = pd.to_datetime(start_date).date()
+      self._end_d = pd.to_datetime(end_date).date()
       self.stock_data = None
+      self._info_cache = None
+
+    @property
+    def stock_data(self):
+      return self._stock_data
+
+    @stock_data.setter
+    def stock_data(self, stock_data):
+      self._stock_data = stock_data
+      # Indicator arrays of the current 'stock_data', memoized by window so that the moving average and the Bollinger Bands share their work.
+      # Reset on every assignment, whether by 'fetch_stock_data' or by hand, so a new frame never gets the arrays of the previous one.
+      self._ma_cache = {}
+      self._band_cache = {}
+
+    @property
+    def ticker(self):
+      # Created on first use so that constructing an object does not import yfinance
+      return _ticker(self.symbol)
+
+    def _info(self):
+
+      """
+      Returns the yahoo finance 'info' dictionary of the ticker. It is a heavy download, so it is fetched at most once per object and shared across objects through the local cache.
+      """
+
+      if self._info_cache is None:
+        info_path = _cache_path("json", self.symbol, "info")
+        info = _load(info_path, INFO_CACHE_TTL)
+        if info is None:
+          info = self.ticker.info
+          _store(info_path, info)
+        self._info_cache = info
+      return self._info_cache
+
+    def _validate(self):
+
+      """
+      Checks the ticker against its 'info' and returns an error message when it is not an equity, or when the requested dates fall before its listing date or after today. Returns None when the ticker is valid.
+      """
+
+      info = self._info()
 
-    def fetch_stock_data(self):
+      if info['quoteType'] != 'EQUITY':   # Validating that the symbol submitted by the user corresponds to a legitimate equity or stock ticker, excluding other forms of tickers like mutual funds.
+        return "Symbol Error: Ticker does not belong to stock/equity"
+      elif self._start_d < date.fromtimestamp(info['firstTradeDateEpochUtc']):   # Validate start_date and ascertain it does not precede the stock's listing date.
+        return "Date Error: Start Date before stock List Date"
+      elif self._end_d > date.today():   # Validate end date for a future date
+        return "Date Error: End Date after today's date"
+      return None
+
+    def fetch_stock_data(self, validate=True, verbose=False):
 
       """
-      The 'fetch_stock_data' function utilizes 'yf.download' to retrieve the data, storing it in the 'stock_data' variable as a dataframe with columns: Date, Open, High, Low, Close, Adj Close, and Volume.
+      The 'fetch_stock_data' function utilizes 'yf.download' to retrieve the data (served from a local cache under '~/.cache/stockanalysis' for a day after the first download), storing it in the 'stock_data' variable as a dataframe indexed by Date with columns: Open, High, Low, Close, Adj Close, and Volume. Prices are stored as float32 and Volume as the smallest fitting unsigned integer type.
 
       Attributes:
-        None
+        validate(optional): Check that the ticker is an equity and that the dates fall between its listing date and today, default True. Set to False to skip the ticker 'info' download when the ticker is trusted.
+        verbose(optional): Print a confirmation and the 'stock_data' summary once fetched, default False. The summary walks every column, so it is left out by default.
 
       Return: Object
       """
 
-      self.ticker = yf.Ticker(self.symbol)
-      info = None
-      today_date = date.today()
-
       try:
-        info = self.ticker.info
-        quoteType = info['quoteType']
-
-        if quoteType != 'EQUITY':   # Validating that the symbol submitted by the user corresponds to a legitimate equity or stock ticker, excluding other forms of tickers like mutual funds.
-          raise Exception("Symbol Error: Ticker does not belong to stock/equity")
-        else:
-          list_date = datetime.fromtimestamp(info['firstTradeDateEpochUtc']).strftime('%Y-%m-%d')
-          if self.start_date < list_date:   # Validate start_date and ascertain it does not precede the stock's listing date.
-            raise Exception("Date Error: Start Date before stock List Date")
-          elif self.end_date > str(today_date):   # Validate end date for a future date
-            raise Exception("Date Error: End Date after today's date")
-          else:
-            self.stock_data = yf.download(self.symbol, start=self.start_date, end=self.end_date)
-            self.stock_data["Date"] = self.stock_data.index
-            self.stock_data = self.stock_data[["Date", "Open", "High","Low", "Close", "Adj Close", "Volume"]]
-            self.stock_data.reset_index(drop=True, inplace=True)
-            print("Stock data fetched successfully.")
-            print(self.stock_data.info())
+        if validate:
+          error = self._validate()
+          if error:
+            raise Exception(error)
+
+        # Copied because the indicator functions add their columns to 'stock_data'
+        self.stock_data = _fetch_ohlcv(self.symbol, self.start_date, self.end_date).copy()
+        if verbose:
+          print("Stock data fetched successfully.")
+          self.stock_data.info()
       except Exception as e:
         if "404 Client Error" in str(e):
           print("Ticker {} does not exist.".format(self.symbol))
@@ -76,13 +580,30 @@ class StockAnalysis:
         elif "Symbol" in str(e):
           print(e)
 
-    def calculate_moving_average(self, window = 21):
+    def _sma(self, window):
+
+      """
+      Returns the moving average of the closing prices over 'window', computed at most once per window for the current 'stock_data'.
+      """
+
+      ma = self._ma_cache.get(window)
+      if ma is None:
+        close = self.stock_data['Close'].to_numpy()
+        if bn is not None:
+          ma = bn.move_mean(close.astype(np.float64), window=window, min_count=window)
+        else:
+          ma = _rolling_mean(close, window)
+        self._ma_cache[window] = ma
+      return ma
+
+    def calculate_moving_average(self, window = 21, verbose = False):
 
       """
       This function is designed to compute the moving average over the stock data. The resulting value is then computed and stored as a new column in the 'stock_data' dataframe, named 'MA'.
 
       Attribute:
         window(optional): The period over which the moving average is calculated, default 21
+        verbose(optional): Print a confirmation once calculated, default False
 
       Return: Object
       """
@@ -90,13 +611,14 @@ class StockAnalysis:
       self.window = window
 
       try:
-          # Calculate moving average
-          self.stock_data['MA'] = self.stock_data['Close'].rolling(window=window).mean()
-          print(f"Moving average (window={window}) calculated successfully.")
+          # Calculate moving average, reused when already computed for this window, e.g. by the Bollinger Bands
+          self.stock_data['MA'] = self._sma(window)
+          if verbose:
+            print(f"Moving average (window={window}) calculated successfully.")
       except Exception as e:
           print(f"Error calculating moving average: {e}")
 
-    def calculate_macd(self, short_window=13, long_window=33, signal_window=9):
+    def calculate_macd(self, short_window=13, long_window=33, signal_window=9, verbose=False):
 
       """
       The function is employed to compute Moving Average Convergence/Divergence (MACD) values based on specified window configurations. The values of macd and signal lines are stored as additional columns to the stock_data dataframe, with column names as 'MACD' and 'Signal_Line'.
@@ -105,25 +627,28 @@ class StockAnalysis:
         short_window(optional): specify the short window for macd caluclation, default 13
         long_window(optional): specify the long window for macd caluclation, default 33
         signal_window(optional): specify the singal window for macd caluclation, default 9
+        verbose(optional): Print a confirmation once calculated, default False
 
       Return: Object
       """
       
       try:
-          # Calculate short-term and long-term exponential moving averages
-          short_ema = self.stock_data['Close'].ewm(span=short_window, adjust=False).mean()
-          long_ema = self.stock_data['Close'].ewm(span=long_window, adjust=False).mean()
-
-          # Calculate MACD and signal line
-          self.stock_data['MACD'] = short_ema - long_ema
-          self.stock_data['Signal_Line'] = self.stock_data['MACD'].ewm(span=signal_window,\
-                                                                       adjust=False).mean()
-
-          print("MACD analysis calculated successfully.")
+          # Calculate short-term, long-term and signal exponential moving averages in one pass
+          macd, signal = _macd_kernel(self.stock_data['Close'].to_numpy(),
+                                      2.0 / (short_window + 1),
+                                      2.0 / (long_window + 1),
+                                      2.0 / (signal_window + 1))
+
+          # Store MACD and signal line
+          self.stock_data['MACD'] = macd
+          self.stock_data['Signal_Line'] = signal
+
+          if verbose:
+            print("MACD analysis calculated successfully.")
       except Exception as e:
           print(f"Error calculating MACD analysis: {e}")
 
-    def calculate_bollinger_bands(self, window=20, num_std=2):
+    def calculate_bollinger_bands(self, window=20, num_std=2, verbose=False):
 
       """
       The function is employed to compute the upper and lower bands for Bollinger Bands. The calculated values are stored in the 'stock_data' dataframe under the columns 'Upper_Band' and 'Lower_Band' respectively.
@@ -131,51 +656,80 @@ class StockAnalysis:
       Attributes:
         window(optional): specify the window to calculate bollinger bands, default 20
         num_std(optional): specify the number of standard devision, default 2
+        verbose(optional): Print a confirmation once calculated, default False
       
       Return: Object
       """
       
-      try:
-          # Calculate moving average
-          self.stock_data['MA'] = self.stock_data['Close'].rolling(window=window).mean()
-
-          # Calculate standard deviation
-          self.stock_data['STD'] = self.stock_data['Close'].rolling(window=window).std()
-
-          # Calculate upper and lower Bollinger Bands
-          self.stock_data['Upper_Band'] = self.stock_data['MA'] + (num_std * self.stock_data['STD'])
-          self.stock_data['Lower_Band'] = self.stock_data['MA'] - (num_std * self.stock_data['STD'])
+      # The bands overwrite the 'MA' column, so the moving average plot is labelled with this window
+      self.window = window
 
-          print(f"Bollinger Bands (window={window}, num_std={num_std}) calculated successfully.")
+      try:
+          # Calculate moving average and upper and lower Bollinger Bands in a single pass, unless already done for these settings
+          bands = self._band_cache.get((window, num_std))
+          if bands is None:
+            ma, upper, lower = _bollinger_kernel(self.stock_data['Close'].to_numpy(), window, float(num_std))
+            # The pass yields the moving average for free, so a later 'calculate_moving_average' with this window reuses it
+            self._ma_cache.setdefault(window, ma)
+            bands = self._band_cache[(window, num_std)] = (upper, lower)
+          upper, lower = bands
+          self.stock_data['MA'] = self._ma_cache[window]
+          self.stock_data['Upper_Band'] = upper
+          self.stock_data['Lower_Band'] = lower
+
+          if verbose:
+            print(f"Bollinger Bands (window={window}, num_std={num_std}) calculated successfully.")
       except Exception as e:
           print(f"Error calculating Bollinger Bands: {e}")
 
-    def calculate_rsi(self, window=14):
+    def calculate_rsi(self, window=14, verbose=False):
 
       """
-      The function is used to calculate the relative strength index (RSI) of the stock. The calculated RSI values are stored in the 'stock_data' dataframe under the column 'RSI'. 
+      The function is used to calculate the relative strength index (RSI) of the stock using Wilder's smoothing of the average gains and losses. The calculated RSI values are stored in the 'stock_data' dataframe under the column 'RSI'. 
 
       Attributes:
         window(optional): specify the period over which RSI is caluclated, default 14
+        verbose(optional): Print a confirmation once calculated, default False
       
       Return: Object
       """
       
       try:
-          # Calculate daily price changes
-          daily_changes = self.stock_data['Close'].diff()
-          # Calculate average gains and losses over the specified window
-          avg_gain = daily_changes.where(daily_changes > 0, 0).rolling(window=window).mean()
-          avg_loss = -daily_changes.where(daily_changes < 0, 0).rolling(window=window).mean()
-          # Calculate Relative Strength (RS)
-          relative_strength = avg_gain / avg_loss
-          # Calculate Relative Strength Index (RSI)
-          self.stock_data['RSI'] = 100 - (100 / (1 + relative_strength))
-          print(f"RSI (window={window}) calculated successfully.")
+          # Calculate daily price changes, split into gains and losses on the raw array
+          gains, losses = _split_changes(self.stock_data['Close'].to_numpy())
+          # Calculate Relative Strength Index (RSI) with Wilder's smoothing of average gains and losses
+          self.stock_data['RSI'] = _rsi_kernel(gains, losses, window)
+          if verbose:
+            print(f"RSI (window={window}) calculated successfully.")
       except Exception as e:
           print(f"Error calculating RSI: {e}")
 
-    def visualize_data(self, plot_start = None, plot_end = None, options = None):
+    def _validate_range(self, start, end):
+
+      """
+      Returns an error message when there is no data to plot or the requested plot range falls outside the fetched date range, otherwise None.
+      """
+
+      if self.stock_data is None:
+        return "Data Error: Stock data not fetched"
+      elif pd.Timestamp(start).date() < self._start_d:
+        return "Date Error: Plot Start date provided is before the Data Fetch start date"
+      elif pd.Timestamp(end).date() > self._end_d:
+        return "Date Error: Plot End date provided is after the Data Fetch end date"
+      return None
+
+    def _slice(self, start, end):
+
+      """
+      Returns the rows of 'stock_data' between 'start' and 'end' (inclusive). Date is a sorted DatetimeIndex, so the bounds are found by binary search and the rows taken as a positional slice instead of building boolean masks.
+      """
+
+      dates = self.stock_data.index.values
+      lo = np.searchsorted(dates, np.datetime64(start))
+      hi = np.searchsorted(dates, np.datetime64(end), side='right')
+      return self.stock_data.iloc[lo:hi]
+
+    def visualize_data(self, plot_start = None, plot_end = None, options = None, return_fig = False, max_points = 5000):
 
       """
       This function offers users the capability to visualize the entire stock data using candlesticks, a widely employed visualization method in financial markets for price representation. 
@@ -184,147 +738,254 @@ class StockAnalysis:
         plot_start(optional): Specify start date for the plot, default data start date.
         plot_end(optional): Specify end date for the plot, default data end date.
         options(optional): Specify if you want to plot "ma", "macd", "macd_hist", "bollinger_bands" or "rsi".  
+        return_fig(optional): Return the plotly figure instead of showing it, useful when plotting many symbols, default False.
+        max_points(optional): Longer ranges are downsampled to this many points with LTTB on the plotted series (the indicator for "macd", "macd_hist" and "rsi", the close price otherwise), default 5000. None plots every point.
 
-      Output: Graph
+      Output: Graph, or the plotly Figure when return_fig is True
       """
 
+      import plotly.graph_objects as go
+
       plot_start = plot_start or self.start_date
       plot_end = plot_end or self.end_date
 
+      error = self._validate_range(plot_start, plot_end)
+      if error is None and options in PLOT_REQUIREMENTS:
+        column, message = PLOT_REQUIREMENTS[options]
+        if column not in self.stock_data.columns:
+          error = message
+      if error:
+        print(error)
+        return
+
+      plot_data = self._slice(plot_start, plot_end)
+      if max_points and len(plot_data) > max_points:
+        # Keep the points that preserve the shape of the plotted series, so plotly serializes at most max_points rows. The indicator only
+        # plots follow the indicator itself, the price based ones the close price.
+        if options == "macd_hist":
+          shape = plot_data['MACD'].to_numpy() - plot_data['Signal_Line'].to_numpy()
+        elif options in ("macd", "rsi"):
+          shape = plot_data[PLOT_REQUIREMENTS[options][0]].to_numpy()
+        else:
+          shape = plot_data['Close'].to_numpy()
+        plot_data = plot_data.iloc[_lttb(plot_data.index.values.astype(np.int64), shape, max_points)]
+      # Extract the arrays once and hand plotly plain ndarrays instead of building Series for every trace
+      dates = plot_data.index.values
+      opens = plot_data['Open'].to_numpy()
+      highs = plot_data['High'].to_numpy()
+      lows = plot_data['Low'].to_numpy()
+      closes = plot_data['Close'].to_numpy()
+
+      if options == "ma":
+        candlestick_trace = go.Candlestick(x=dates,
+                                open=opens,
+                                high=highs,
+                                low=lows,
+                                close=closes,
+                                name='Value')
+        ma_trace = go.Scattergl(x=dates,
+                                y=plot_data['MA'].to_numpy(),
+                                mode='lines',
+                                name=f'Moving Average ({self.window}-day)',
+                                line=dict(color="#0000ff"))
+
+        fig = go.Figure(data=[candlestick_trace, ma_trace], layout=_layouts()["ma"])
+      elif options == "macd":
+        macd_trace = go.Scattergl(x=dates, y=plot_data['MACD'].to_numpy(), mode='lines', name='MACD')
+        signal_trace = go.Scattergl(x=dates, y=plot_data['Signal_Line'].to_numpy(), mode='lines', name='Signal Line')
+        fig = go.Figure(data=[macd_trace, signal_trace], layout=_layouts()["macd"])
+      elif options == "macd_hist":
+        # Visualize MACD Histogram, computed for the plotted range only
+        histogram = plot_data['MACD'].to_numpy() - plot_data['Signal_Line'].to_numpy()
+        histogram_trace = go.Bar(x=dates, y=histogram, name='MACD Histogram')
+        fig = go.Figure(data=[histogram_trace], layout=_layouts()["macd_hist"])
+      elif options == "bollinger_bands":
+        candlestick_trace = go.Candlestick(x=dates,
+                                          open=opens,
+                                          high=highs,
+                                          low=lows,
+                                          close=closes,
+                                          name='Candlestick')
+        upper_band_trace = go.Scattergl(x=dates,
+                                        y=plot_data['Upper_Band'].to_numpy(),
+                                        mode='lines',
+                                        name='Upper Bollinger Band',
+                                        line=dict(color="#FF5733"))
+        lower_band_trace = go.Scattergl(x=dates,
+                                        y=plot_data['Lower_Band'].to_numpy(),
+                                        mode='lines',
+                                        name='Lower Bollinger Band',
+                                        line=dict(color="#33FF57"))
+        fig = go.Figure(data=[candlestick_trace, upper_band_trace, lower_band_trace], layout=_layouts()["bollinger_bands"])
+      elif options == "rsi":
+        rsi_trace = go.Scattergl(x=dates, y=plot_data['RSI'].to_numpy(), mode='lines', name='RSI', line=dict(color="#FF5733"))
+        fig = go.Figure(data=[rsi_trace], layout=_layouts()["rsi"])
+
+        # Add horizontal lines for overbought and oversold levels
+        fig.add_hline(y=70, line_color="#FF0000", annotation_text="Overbought")
+        fig.add_hline(y=30, line_color="#00FF00", annotation_text="Oversold")
+      else:
+        fig = go.Figure(data=[go.Candlestick(x=dates,open=opens,\
+                                            high=highs,low=lows, close=closes)], layout=_layouts()["candlestick"])
+      if return_fig:
+        return fig
+      fig.show()
+
+    def get_latest_news(self):
+
+      """
+      In addition to the technical aspects, market news significantly influences stocks. This function offers users the option to retrieve and read the latest news relevant to the stock they are analyzing. In the event of available news, the function provides three key details: the news title, a link to the website for accessing the complete article, and the name of the publisher.
+
+      Attributes:
+        None
+
+      Return: String
+      """
+      
       try:
-        # Validate if the specified date is within the data date range
+        news_path = _cache_path("json", self.symbol, "news")
+        latest_news = _load(news_path, NEWS_CACHE_TTL)
+        if latest_news is None:
+          latest_news = self.ticker.news
+          _store(news_path, latest_news)
 
-        if plot_start < self.start_date:
-          raise Exception("Date Error: Plot Start date provided is before the Data Fetch start date")
-        elif plot_end > self.end_date:
-          raise Exception("Date Error: Plot End date provided is after the Data Fetch end date")
+        if not latest_news:
+          raise Exception("No News: Cannot fetch latest news.")
+        else:
+          # Built into one string and written once rather than three prints per article
+          items = [f"Title: {news.get('title', '')}\nLink: {news.get('link', '')}\nPublisher: {news.get('publisher', '')}\n"
+                   for news in latest_news]
+          sys.stdout.write("\n\n".join(items) + "\n")
       except Exception as e:
         print(e)
-      else:
-        try:
-          if options == "ma":
-            if "MA" not in self.stock_data.columns:
-              raise Exception("Moving average not calculated")
-            else:
-              plot_data = self.stock_data[(self.stock_data['Date'] >= plot_start) & (self.stock_data['Date'] <= plot_end)]
-
-              candlestick_trace = go.Candlestick(x=plot_data['Date'],
-                                      open=plot_data['Open'],
-                                      high=plot_data['High'],
-                                      low=plot_data['Low'],
-                                      close=plot_data['Close'],
-                                      name='Value')
-              ma_trace = go.Scatter(x=plot_data['Date'],
-                                    y=plot_data['MA'],
-                                    mode='lines',
-                                    name=f'Moving Average ({self.window}-day)',
-                                    line=dict(color="#0000ff"))
-
-              layout = go.Layout(title='Candlestick Chart with Moving Average',
-                                xaxis=dict(title='Date'),
-                                yaxis=dict(title='Price'))
-
-              fig = go.Figure(data=[candlestick_trace, ma_trace], layout=layout)
-              fig.update_layout(xaxis_rangeslider_visible=False)
-          elif options == "macd":
-            if "MACD" not in self.stock_data.columns:
-              raise Exception("MACD not calculated")
-            else:
-              plot_data = self.stock_data[(self.stock_data['Date'] >= plot_start) & (self.stock_data['Date'] <= plot_end)]
 
-              macd_trace = go.Scatter(x=plot_data['Date'], y=plot_data['MACD'], mode='lines', name='MACD')
-              signal_trace = go.Scatter(x=plot_data['Date'], y=plot_data['Signal_Line'], mode='lines', name='Signal Line')
+    @classmethod
+    def fetch_many(cls, symbols, start_date, end_date, validate=True, workers=None, verbose=False):
 
-              layout = go.Layout(title='MACD Indicator',
-                          xaxis=dict(title='Date'),
-                          yaxis=dict(title='MACD Value'))
-              fig = go.Figure(data=[macd_trace, signal_trace], layout=layout)
-          elif options == "macd_hist":
-            if "MACD" not in self.stock_data.columns:
-              raise Exception("MACD not calculated")
-            else:
-              self.stock_data['MACD_Histogram'] = self.stock_data['MACD'] - self.stock_data['Signal_Line']
+      """
+      This function fetches the stock data of several symbols at once. The symbols are validated concurrently, and every symbol that is not already in the local cache is downloaded in a single threaded 'yf.download' call instead of one request per object, or spread over a pool of worker processes when 'workers' is given. Symbols failing validation or download are reported and left out. When using worker processes from a script, call this function under an 'if __name__ == "__main__":' guard.
 
-              # Visualize MACD Histogram
-              plot_data = self.stock_data[(self.stock_data['Date'] >= plot_start) & (self.stock_data['Date'] <= plot_end)]
-              histogram_trace = go.Bar(x=plot_data['Date'], y=plot_data['MACD_Histogram'], name='MACD Histogram')
+      Attributes:
+        symbols: A list of ticker strings in the yahoo finance market.
+        start_date: A string value in the 'yyyy-mm-dd' format, determining the commencement date from which the data is to be fetched.
+        end_date: A string value in the 'yyyy-mm-dd' format, indicating the termination date until which the data should be fetched.
+        validate(optional): Check every ticker as 'fetch_stock_data' does, default True.
+        workers(optional): Number of processes downloading one symbol each, default None for a single batched download.
+        verbose(optional): Print a confirmation once fetched, default False
 
-              layout = go.Layout(title='MACD Histogram',
-                          xaxis=dict(title='Date'),
-                          yaxis=dict(title='MACD Histogram'))
+      Return: Dictionary of StockAnalysis objects with 'stock_data' already fetched, keyed by symbol
+      """
 
-              fig = go.Figure(data=[histogram_trace], layout=layout)
-          elif options == "bollinger_bands":
-            if "Upper_Band" not in self.stock_data.columns:
-              raise Exception("Bollinger bands are not calculated")
-            else:
-              plot_data = self.stock_data[(self.stock_data['Date'] >= plot_start) & (self.stock_data['Date'] <= plot_end)]
-              candlestick_trace = go.Candlestick(x=plot_data['Date'],
-                                                open=plot_data['Open'],
-                                                high=plot_data['High'],
-                                                low=plot_data['Low'],
-                                                close=plot_data['Close'],
-                                                name='Candlestick')
-              upper_band_trace = go.Scatter(x=plot_data['Date'],
-                                            y=plot_data['Upper_Band'],
-                                            mode='lines',
-                                            name='Upper Bollinger Band',
-                                            line=dict(color="#FF5733"))
-              lower_band_trace = go.Scatter(x=plot_data['Date'],
-                                            y=plot_data['Lower_Band'],
-                                            mode='lines',
-                                            name='Lower Bollinger Band',
-                                            line=dict(color="#33FF57"))
-              layout = go.Layout(title='Bollinger Bands',
-                                xaxis=dict(title='Date'),
-                                yaxis=dict(title='Price'))
-
-              fig = go.Figure(data=[candlestick_trace, upper_band_trace, lower_band_trace], layout=layout)
-              fig.update_layout(xaxis_rangeslider_visible=False)
-          elif options == "rsi":
-            if "RSI" not in self.stock_data.columns:
-              raise Exception("RSI not calculated")
+      stocks = {symbol: cls(symbol, start_date, end_date) for symbol in symbols}
+
+      if validate:
+        # Each validation downloads the ticker info, independent network calls that can overlap
+        with ThreadPoolExecutor() as pool:
+          futures = {symbol: pool.submit(stock._validate) for symbol, stock in stocks.items()}
+        for symbol, future in futures.items():
+          try:
+            error = future.result()
+          except Exception as e:
+            error = "Ticker {} does not exist.".format(symbol) if "404 Client Error" in str(e) else e
+          if error:
+            print(error)
+            del stocks[symbol]
+
+      missing = []
+      for symbol, stock in stocks.items():
+        stock.stock_data = _load(_parquet_path(symbol, start_date, end_date), PRICE_CACHE_TTL)
+        if stock.stock_data is None:
+          missing.append(symbol)
+
+      try:
+        if missing and workers:
+          with multiprocessing.Pool(workers) as pool:
+            results = {symbol: pool.apply_async(_fetch_ohlcv, (symbol, start_date, end_date), error_callback=print)
+                       for symbol in missing}
+            pool.close()
+            pool.join()
+          for symbol, result in results.items():
+            if result.successful():
+              stocks[symbol].stock_data = result.get()
             else:
-              plot_data = self.stock_data[(self.stock_data['Date'] >= plot_start) & (self.stock_data['Date'] <= plot_end)]
-
-              rsi_trace = go.Scatter(x=plot_data['Date'], y=plot_data['RSI'], mode='lines', name='RSI', line=dict(color="#FF5733"))
-
-              # Add horizontal lines for overbought and oversold levels
-              overbought_trace = go.Scatter(x=plot_data['Date'], y=[70] * len(plot_data), mode='lines', name='Overbought', line=dict(color="#FF0000"))
-              oversold_trace = go.Scatter(x=plot_data['Date'], y=[30] * len(plot_data), mode='lines', name='Oversold', line=dict(color="#00FF00"))
-              layout = go.Layout(title='Relative Strength Index (RSI)',
-                                xaxis=dict(title='Date'),
-                                yaxis=dict(title='RSI'))
-              fig = go.Figure(data=[rsi_trace, overbought_trace, oversold_trace], layout=layout)
-              fig.update_layout(xaxis_rangeslider_visible=False)
-          else:
-            plot_data = self.stock_data[(self.stock_data['Date'] >= plot_start) & (self.stock_data['Date'] <= plot_end)]
-
-            fig = go.Figure(data=[go.Candlestick(x=plot_data['Date'],open=plot_data['Open'],\
-                                                high=plot_data['High'],low=plot_data['Low'], close=plot_data['Close'])])
-            fig.update_layout(xaxis_rangeslider_visible=False)
-          fig.show()
-        except Exception as e:
-          print(e)
+              del stocks[symbol]
+        elif missing:
+          import yfinance as yf
+          with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            data = yf.download(missing, start=start_date, end=end_date, group_by='ticker', threads=True,
+                               auto_adjust=False, progress=False)
+          for symbol in missing:
+            ohlcv = data[symbol].dropna(how='all')
+            if ohlcv.empty:   # Failed symbols come back as all-NaN columns, report and leave them out like failed validations
+              print(_no_data_error(symbol, start_date, end_date))
+              del stocks[symbol]
+              continue
+            stocks[symbol].stock_data = _prepare_ohlcv(ohlcv)
+            _store(_parquet_path(symbol, start_date, end_date), stocks[symbol].stock_data)
+        if verbose:
+          print(f"Stock data fetched successfully for {len(stocks)} symbols.")
+      except Exception as e:
+        print(f"Error fetching stock data: {e}")
+      # A download failing as a whole, or part way through, leaves symbols without data, which are left out like the others
+      return {symbol: stock for symbol, stock in stocks.items() if stock.stock_data is not None}
 
-    def get_latest_news(self):
+    @classmethod
+    def batch(cls, symbols, start_date, end_date, ma_window=21, short_window=13, long_window=33, signal_window=9, rsi_window=14, verbose=False):
 
       """
-      In addition to the technical aspects, market news significantly influences stocks. This function offers users the option to retrieve and read the latest news relevant to the stock they are analyzing. In the event of available news, the function provides three key details: the news title, a link to the website for accessing the complete article, and the name of the publisher.
+      This function analyzes a whole watchlist at once. The closing prices of all 'symbols' are downloaded in a single 'yf.download' call, symbols without any price are reported and left out, the others are aligned on the dates every one of them traded (with a warning when that shortens the history), and the moving average, MACD and RSI are then computed for all symbols in parallel.
 
       Attributes:
-        None
+        symbols: A list of ticker strings in the yahoo finance market.
+        start_date: A string value in the 'yyyy-mm-dd' format, determining the commencement date from which the data is to be fetched.
+        end_date: A string value in the 'yyyy-mm-dd' format, indicating the termination date until which the data should be fetched.
+        ma_window(optional): The period over which the moving average is calculated, default 21
+        short_window(optional): specify the short window for macd caluclation, default 13
+        long_window(optional): specify the long window for macd caluclation, default 33
+        signal_window(optional): specify the singal window for macd caluclation, default 9
+        rsi_window(optional): specify the period over which RSI is caluclated, default 14
+        verbose(optional): Print a confirmation once calculated, default False
 
-      Return: String
+      Return: Dictionary of dataframes indexed by Date with columns Close, MA, MACD, Signal_Line, MACD_Histogram and RSI, keyed by symbol
       """
-      
+
+      import yfinance as yf
+
+      symbols = list(symbols)
+
       try:
-        if not self.ticker.news:
-          raise Exception("No News: Cannot fetch latest news.")
-        else:
-          for news in self.ticker.news:
-            print("Title: ", news['title'])
-            print("Link: ", news['link'])
-            print("Publisher: ", news['publisher'],"\n\n")
+        with warnings.catch_warnings():
+          warnings.simplefilter('ignore', FutureWarning)
+          data = yf.download(symbols, start=start_date, end=end_date, group_by='ticker', auto_adjust=False, progress=False)
+        close_data = data.xs('Close', axis=1, level=1)[symbols].dropna(how='all')
+        # A failed or delisted symbol has no prices at all and would empty the intersection below for every symbol
+        failed = close_data.columns[close_data.isna().all()]
+        for symbol in failed:
+          print(_no_data_error(symbol, start_date, end_date))
+        close_data = close_data.drop(columns=failed)
+        symbols = [symbol for symbol in symbols if symbol not in failed]
+        if not symbols:
+          raise Exception("No price data for any symbol")
+        traded_dates = len(close_data)
+        close_data = close_data.dropna()
+        if len(close_data) < traded_dates:
+          print(f"Date Warning: Only {len(close_data)} of {traded_dates} dates are traded by every symbol, the analysis covers those dates only")
+        # float32 like fetch_stock_data, the kernels accumulate in float64
+        closes = np.ascontiguousarray(close_data.to_numpy(dtype=np.float32).T)
+
+        ma = _batch_ma(closes, ma_window)
+        macd, signal = _batch_macd(closes, 2.0 / (short_window + 1), 2.0 / (long_window + 1), 2.0 / (signal_window + 1))
+        gains, losses = _split_changes(closes)
+        rsi = _batch_rsi(gains, losses, rsi_window)
+
+        results = {}
+        for i, symbol in enumerate(symbols):
+          results[symbol] = pd.DataFrame({'Close': closes[i], 'MA': ma[i], 'MACD': macd[i], 'Signal_Line': signal[i],
+                                          'MACD_Histogram': macd[i] - signal[i], 'RSI': rsi[i]},
+                                         index=close_data.index)
+        if verbose:
+          print(f"Batch analysis of {len(symbols)} symbols calculated successfully.")
+        return results
       except Exception as e:
-        print(e)
\ No newline at end of file
+        print(f"Error running batch analysis: {e}")
\ No newline at end of file
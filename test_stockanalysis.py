@@ -0,0 +1,284 @@
+import os
+import signal
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import StockAnalysisPackage
+from StockAnalysisPackage import StockAnalysis
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Stand-in for yfinance, shaped like yfinance 1.x downloads. Symbols starting with 'BAD' have no prices at all, those starting with 'NEW'
+# are listed 20 days late.
+FAKE_YFINANCE = '''
+import numpy as np
+import pandas as pd
+
+PRICES = ["Adj Close", "Close", "High", "Low", "Open", "Volume"]
+downloads = []
+
+
+def _history(symbol, start, end):
+    dates = pd.bdate_range(start, end, inclusive="left", name="Date")
+    if symbol.startswith("BAD"):
+        return pd.DataFrame(np.nan, index=dates, columns=PRICES)
+    rng = np.random.default_rng(sum(map(ord, symbol)))
+    close = 100 + np.cumsum(rng.normal(size=len(dates)))
+    history = pd.DataFrame({price: close for price in PRICES}, index=dates)
+    history["Volume"] = rng.integers(1000, 5000, size=len(dates))
+    if symbol.startswith("NEW"):
+        history.iloc[:20] = np.nan
+    return history
+
+
+def download(tickers, start=None, end=None, group_by="column", **kwargs):
+    downloads.append(tickers)
+    if isinstance(tickers, str):
+        history = _history(tickers, start, end).dropna(how="all")
+        history.columns = pd.MultiIndex.from_product([history.columns, [tickers]], names=["Price", "Ticker"])
+        return history
+    data = pd.concat({symbol: _history(symbol, start, end) for symbol in tickers}, axis=1, names=["Ticker", "Price"])
+    return data if group_by == "ticker" else data.swaplevel(axis=1)
+'''
+
+
+@pytest.fixture
+def yf(tmp_path, monkeypatch):
+    (tmp_path / "yfinance.py").write_text(FAKE_YFINANCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "yfinance", raising=False)
+    monkeypatch.setattr(StockAnalysisPackage, "_cache_dir", tmp_path / "stockanalysis")
+    monkeypatch.setattr(StockAnalysisPackage, "_ohlcv_memo", {})
+    import yfinance
+    return yfinance
+
+
+def wilder_rsi(close, window):
+    # Reference RSI: pandas gains and losses, seeded with their simple mean and then smoothed with Wilder's recursion
+    change = pd.Series(close, dtype=np.float64).diff()
+    gains = change.where(change > 0, 0).to_numpy()
+    losses = -change.where(change < 0, 0).to_numpy()
+    rsi = np.full(len(close), np.nan)
+    avg_gain = gains[1:window + 1].mean()
+    avg_loss = losses[1:window + 1].mean()
+    for i in range(window, len(close)):
+        if i > window:
+            avg_gain = (avg_gain * (window - 1) + gains[i]) / window
+            avg_loss = (avg_loss * (window - 1) + losses[i]) / window
+        rsi[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return rsi
+
+
+@pytest.fixture
+def stock():
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(size=300))
+    stock = StockAnalysis("TEST", "2020-01-01", "2021-01-01")
+    stock.stock_data = pd.DataFrame({"Close": close.astype(np.float32)},
+                                    index=pd.date_range("2020-01-01", periods=300, name="Date"))
+    return stock
+
+
+def test_calculate_indicators(stock):
+    pytest.importorskip("numba")
+    close = stock.stock_data["Close"].astype(np.float64)
+    stock.calculate_moving_average(21)
+    stock.calculate_macd()
+    stock.calculate_bollinger_bands(20)
+    stock.calculate_rsi()
+
+    data = stock.stock_data
+    for column in ["MA", "MACD", "Signal_Line", "Upper_Band", "Lower_Band", "RSI"]:
+        assert column in data, column
+    ma = close.rolling(20).mean()
+    std = close.rolling(20).std()
+    np.testing.assert_allclose(data["MA"][19:], ma[19:], rtol=1e-9)
+    np.testing.assert_allclose(data["Upper_Band"][19:], (ma + 2 * std)[19:], rtol=1e-9)
+    np.testing.assert_allclose(data["MACD"], close.ewm(span=13, adjust=False).mean() - close.ewm(span=33, adjust=False).mean(),
+                               rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(data["RSI"], wilder_rsi(data["Close"].to_numpy(), 14), rtol=1e-9)
+
+
+def test_fetch_many_workers_exit(yf, tmp_path):
+    # Forked workers used to hang at exit once the parallel batch kernels were compiled at import
+    script = ("import multiprocessing\n"
+              "multiprocessing.set_start_method('fork')\n"
+              "from StockAnalysisPackage import StockAnalysis\n"
+              "stocks = StockAnalysis.fetch_many(['AAA', 'BBB'], '2020-01-01', '2020-06-01', validate=False, workers=2)\n"
+              "print(sorted(symbol for symbol, stock in stocks.items() if len(stock.stock_data)))\n")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), REPO_DIR]), XDG_CACHE_HOME=str(tmp_path))
+    output_path = tmp_path / "output.txt"
+    with open(output_path, "w") as output:
+        # In its own session so that hung workers can be killed along with the parent
+        process = subprocess.Popen([sys.executable, "-c", script], env=env, stdout=output, stderr=subprocess.STDOUT,
+                                   start_new_session=True)
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            pytest.fail("fetch_many with worker processes did not exit")
+    output = output_path.read_text()
+    assert process.returncode == 0, output
+    assert output.strip().splitlines()[-1] == "['AAA', 'BBB']"
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_rolling_kernels_recover_from_missing_price(dtype):
+    close = (100 + np.cumsum(np.random.default_rng(1).normal(size=120))).astype(dtype)
+    close[50] = np.nan
+    reference = pd.Series(close.astype(np.float64))
+    ma = reference.rolling(20).mean()
+    std = reference.rolling(20).std()
+
+    np.testing.assert_allclose(StockAnalysisPackage._rolling_mean(close, 20), ma, rtol=1e-9)
+    bollinger_ma, upper, lower = StockAnalysisPackage._bollinger_kernel(close, 20, 2.0)
+    np.testing.assert_allclose(bollinger_ma, ma, rtol=1e-9)
+    np.testing.assert_allclose(upper, ma + 2 * std, rtol=1e-9)
+    np.testing.assert_allclose(lower, ma - 2 * std, rtol=1e-9)
+    assert np.isnan(upper[50:70]).all() and not np.isnan(upper[70:]).any()
+
+
+def test_rsi_skips_missing_price():
+    close = (100 + np.cumsum(np.random.default_rng(2).normal(size=120))).astype(np.float32)
+    close[50] = np.nan
+    rsi = StockAnalysisPackage._rsi_kernel(*StockAnalysisPackage._split_changes(close), 14)
+    np.testing.assert_allclose(rsi, wilder_rsi(close, 14), rtol=1e-9)
+
+
+def test_fetch_many_leaves_out_failed_symbols(yf, monkeypatch):
+    stocks = StockAnalysis.fetch_many(["AAA", "BAD"], "2020-01-01", "2020-06-01", validate=False)
+    assert list(stocks) == ["AAA"]
+    assert stocks["AAA"].stock_data["Close"].notna().all()
+
+    def failing_download(*args, **kwargs):
+        raise ConnectionError("network down")
+
+    monkeypatch.setattr(yf, "download", failing_download)
+    assert StockAnalysis.fetch_many(["DDD", "EEE"], "2020-01-01", "2020-06-01", validate=False) == {}
+
+
+def test_lttb_keeps_end_points_and_extremes():
+    x = np.arange(1000)
+    y = np.sin(np.linspace(0, 6 * np.pi, 1000))
+    y[537] = 5.0
+    indices = StockAnalysisPackage._lttb(x, y, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert (np.diff(indices) > 0).all()
+    assert 537 in indices
+    np.testing.assert_array_equal(StockAnalysisPackage._lttb(x, y, 2000), x)
+
+
+def test_visualize_downsamples_the_plotted_indicator(stock):
+    pytest.importorskip("plotly")
+    stock.stock_data["RSI"] = 50.0
+    stock.stock_data.iloc[123, stock.stock_data.columns.get_loc("RSI")] = 95.0
+    stock.stock_data = stock.stock_data.assign(Open=stock.stock_data["Close"], High=stock.stock_data["Close"],
+                                               Low=stock.stock_data["Close"])
+
+    fig = stock.visualize_data(options="rsi", return_fig=True, max_points=30)
+    assert len(fig.data[0].y) == 30
+    assert 95.0 in fig.data[0].y
+
+
+def test_moving_average_follows_replaced_stock_data(stock):
+    stock.calculate_moving_average(21)
+    stock.calculate_bollinger_bands(20)
+    stock.stock_data = stock.stock_data[["Close"]] * 2
+    stock.calculate_moving_average(21)
+    stock.calculate_bollinger_bands(20)
+
+    close = stock.stock_data["Close"].astype(np.float64)
+    np.testing.assert_allclose(stock.stock_data["MA"][19:], close.rolling(20).mean()[19:], rtol=1e-9)
+    np.testing.assert_allclose(stock.stock_data["Upper_Band"][19:], (close.rolling(20).mean() + 2 * close.rolling(20).std())[19:],
+                               rtol=1e-9)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_macd_convolve_matches_ewm(dtype):
+    close = (100 + np.cumsum(np.random.default_rng(3).normal(size=500))).astype(dtype)
+    macd, signal = StockAnalysisPackage._macd_convolve(close, 2.0 / 14, 2.0 / 34, 2.0 / 10)
+
+    reference = pd.Series(close.astype(np.float64))
+    expected_macd = reference.ewm(span=13, adjust=False).mean() - reference.ewm(span=33, adjust=False).mean()
+    np.testing.assert_allclose(macd, expected_macd, rtol=1e-7, atol=1e-7)
+    np.testing.assert_allclose(signal, expected_macd.ewm(span=9, adjust=False).mean(), rtol=1e-7, atol=1e-7)
+
+
+def test_rsi_lfilter_matches_wilder():
+    pytest.importorskip("scipy")
+    close = (100 + np.cumsum(np.random.default_rng(4).normal(size=500))).astype(np.float32)
+    rsi = StockAnalysisPackage._rsi_lfilter(*StockAnalysisPackage._split_changes(close), 14)
+    np.testing.assert_allclose(rsi, wilder_rsi(close, 14), rtol=1e-9)
+
+
+def test_fetch_memo_expires_with_price_ttl(yf, monkeypatch):
+    stock = StockAnalysis("AAA", "2020-01-01", "2020-06-01")
+    stock.fetch_stock_data(validate=False)
+    stock.fetch_stock_data(validate=False)
+    assert yf.downloads == ["AAA"]
+
+    monkeypatch.setattr(StockAnalysisPackage, "PRICE_CACHE_TTL", -1)
+    stock.fetch_stock_data(validate=False)
+    assert yf.downloads == ["AAA", "AAA"]
+
+
+def test_batch_matches_single_symbol_results(yf):
+    results = StockAnalysis.batch(["AAA", "BBB"], "2020-01-01", "2021-01-01")
+    assert list(results) == ["AAA", "BBB"]
+    for symbol, result in results.items():
+        stock = StockAnalysis(symbol, "2020-01-01", "2021-01-01")
+        stock.fetch_stock_data(validate=False)
+        stock.calculate_moving_average(21)
+        stock.calculate_macd()
+        stock.calculate_rsi()
+        expected = stock.stock_data
+        pd.testing.assert_index_equal(result.index, expected.index)
+        for column in ["Close", "MA", "MACD", "Signal_Line", "RSI"]:
+            np.testing.assert_allclose(result[column], expected[column], rtol=1e-9, err_msg=f"{symbol} {column}")
+        np.testing.assert_allclose(result["MACD_Histogram"], expected["MACD"] - expected["Signal_Line"], rtol=1e-9, atol=1e-12)
+
+
+def test_batch_leaves_out_failed_symbol(yf, capsys):
+    results = StockAnalysis.batch(["AAA", "BAD"], "2020-01-01", "2021-01-01")
+    assert list(results) == ["AAA"]
+    assert len(results["AAA"]) == len(pd.bdate_range("2020-01-01", "2021-01-01", inclusive="left"))
+    assert "No price data for BAD" in capsys.readouterr().out
+
+
+def test_batch_reports_shortened_history(yf, capsys):
+    results = StockAnalysis.batch(["AAA", "NEW"], "2020-01-01", "2021-01-01")
+    dates = len(pd.bdate_range("2020-01-01", "2021-01-01", inclusive="left"))
+    assert [len(result) for result in results.values()] == [dates - 20, dates - 20]
+    assert f"Only {dates - 20} of {dates} dates" in capsys.readouterr().out
+
+
+def test_empty_download_is_not_cached(yf, tmp_path):
+    stock = StockAnalysis("BAD", "2020-01-01", "2020-06-01")
+    stock.fetch_stock_data(validate=False)
+    assert stock.stock_data is None
+    assert StockAnalysis.fetch_many(["BAD"], "2020-01-01", "2020-06-01", validate=False) == {}
+    assert StockAnalysisPackage._ohlcv_memo == {}
+    assert not list((tmp_path / "stockanalysis").glob("BAD_*"))
+
+    stock.fetch_stock_data(validate=False)
+    assert yf.downloads == ["BAD", ["BAD"], "BAD"]
+
+
+def test_download_is_cached_on_disk(yf, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    first = StockAnalysis("AAA", "2020-01-01", "2020-06-01")
+    first.fetch_stock_data(validate=False)
+    assert (tmp_path / "stockanalysis" / "AAA_2020-01-01_2020-06-01.parquet").exists()
+
+    # A new process starts with an empty memo and reads the parquet file instead of downloading again
+    monkeypatch.setattr(StockAnalysisPackage, "_ohlcv_memo", {})
+    second = StockAnalysis("AAA", "2020-01-01", "2020-06-01")
+    second.fetch_stock_data(validate=False)
+    assert yf.downloads == ["AAA"]
+    pd.testing.assert_frame_equal(second.stock_data, first.stock_data, check_freq=False)